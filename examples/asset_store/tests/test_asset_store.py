@@ -1,8 +1,9 @@
 import os
 import pickle
-from tempfile import TemporaryDirectory
 
 from dagster import DagsterInstance, execute_pipeline, reexecute_pipeline
+from dagster.core.test_utils import in_memory_temporary_directory
+from dagster.utils import read_pickled_file
 
 from ..builtin_custom_path import custom_path_pipeline
 from ..builtin_default import model_pipeline
@@ -10,7 +11,7 @@
 
 
 def test_builtin_default():
-    with TemporaryDirectory() as tmpdir_path:
+    with in_memory_temporary_directory() as tmpdir_path:
         instance = DagsterInstance.ephemeral()
 
         run_config = {
@@ -23,15 +24,15 @@ def test_builtin_default():
 
         assert result.success
 
-        filepath_call_api = os.path.join(tmpdir_path, result.run_id, "call_api", "result")
+        run_dir = os.path.join(tmpdir_path, result.run_id)
+        filepath_call_api = os.path.join(run_dir, "call_api", "result")
         assert os.path.isfile(filepath_call_api)
         with open(filepath_call_api, "rb") as read_obj:
             assert pickle.load(read_obj) == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 
-        filepath_parse_df = os.path.join(tmpdir_path, result.run_id, "parse_df", "result")
+        filepath_parse_df = os.path.join(run_dir, "parse_df", "result")
         assert os.path.isfile(filepath_parse_df)
-        with open(filepath_parse_df, "rb") as read_obj:
-            assert pickle.load(read_obj) == [1, 2, 3, 4, 5]
+        assert read_pickled_file(filepath_parse_df) == [1, 2, 3, 4, 5]
 
         assert reexecute_pipeline(
             model_pipeline,
@@ -44,7 +45,7 @@ def test_builtin_default():
 
 
 def test_custom_path_asset_store():
-    with TemporaryDirectory() as tmpdir_path:
+    with in_memory_temporary_directory() as tmpdir_path:
 
         instance = DagsterInstance.ephemeral()
 
@@ -65,8 +66,7 @@ def test_custom_path_asset_store():
 
         filepath_parse_df = os.path.join(tmpdir_path, "parse_df_output")
         assert os.path.isfile(filepath_parse_df)
-        with open(filepath_parse_df, "rb") as read_obj:
-            assert pickle.load(read_obj) == [1, 2, 3, 4, 5]
+        assert read_pickled_file(filepath_parse_df) == [1, 2, 3, 4, 5]
 
         assert reexecute_pipeline(
             custom_path_pipeline,
@@ -79,7 +79,7 @@ def test_custom_path_asset_store():
 
 
 def test_builtin_pipeline():
-    with TemporaryDirectory() as tmpdir_path:
+    with in_memory_temporary_directory() as tmpdir_path:
         instance = DagsterInstance.ephemeral()
 
         run_config = {
@@ -92,12 +92,12 @@ def test_builtin_pipeline():
 
         assert result.success
 
-        filepath_call_api = os.path.join(tmpdir_path, result.run_id, "call_api", "result")
+        run_dir = os.path.join(tmpdir_path, result.run_id)
+        filepath_call_api = os.path.join(run_dir, "call_api", "result")
         assert os.path.isfile(filepath_call_api)
         with open(filepath_call_api, "rb") as read_obj:
             assert pickle.load(read_obj) == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 
-        filepath_parse_df = os.path.join(tmpdir_path, result.run_id, "parse_df", "result")
+        filepath_parse_df = os.path.join(run_dir, "parse_df", "result")
         assert os.path.isfile(filepath_parse_df)
-        with open(filepath_parse_df, "rb") as read_obj:
-            assert pickle.load(read_obj) == [1, 2, 3, 4, 5]
+        assert read_pickled_file(filepath_parse_df) == [1, 2, 3, 4, 5]
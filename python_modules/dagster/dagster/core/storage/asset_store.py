@@ -1,9 +1,8 @@
 import os
-import pickle
 from abc import abstractmethod
 from collections import namedtuple
 
-from dagster import check
+from dagster import Bool, check
 from dagster.config import Field
 from dagster.config.source import StringSource
 from dagster.core.definitions.events import AssetKey, EventMetadataEntry
@@ -13,7 +12,7 @@
 from dagster.core.storage.object_manager import ObjectManager
 from dagster.core.types.dagster_type import DagsterType, resolve_dagster_type
 from dagster.serdes import whitelist_for_serdes
-from dagster.utils import PICKLE_PROTOCOL, mkdir_p
+from dagster.utils import mkdir_p, read_pickled_file, write_pickled_file
 from dagster.utils.backcompat import experimental
 
 
@@ -103,12 +102,13 @@ class PickledObjectFilesystemAssetStore(AssetStore):
     Args:
         base_dir (Optional[str]): base directory where all the step outputs which use this asset
             store will be stored in.
+        out_of_band_buffers (Optional[bool]): whether to write large buffers exposed by outputs to
+            separate files with pickle protocol 5. See :py:func:`dagster.utils.write_pickled_file`.
     """
 
-    def __init__(self, base_dir=None):
+    def __init__(self, base_dir=None, out_of_band_buffers=False):
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
-        self.write_mode = "wb"
-        self.read_mode = "rb"
+        self.out_of_band_buffers = check.bool_param(out_of_band_buffers, "out_of_band_buffers")
 
     def _get_path(self, context):
         """Automatically construct filepath."""
@@ -129,8 +129,7 @@ def set_asset(self, context, obj):
         # Ensure path exists
         mkdir_p(os.path.dirname(filepath))
 
-        with open(filepath, self.write_mode) as write_obj:
-            pickle.dump(obj, write_obj, PICKLE_PROTOCOL)
+        write_pickled_file(filepath, obj, out_of_band_buffers=self.out_of_band_buffers)
 
     def get_asset(self, context):
         """Unpickle the file and Load it to a data object."""
@@ -138,11 +137,22 @@ def get_asset(self, context):
 
         filepath = self._get_path(context)
 
-        with open(filepath, self.read_mode) as read_obj:
-            return pickle.load(read_obj)
-
-
-@resource(config_schema={"base_dir": Field(StringSource, default_value=".", is_required=False)})
+        return read_pickled_file(filepath)
+
+
+@resource(
+    config_schema={
+        "base_dir": Field(StringSource, default_value=".", is_required=False),
+        "out_of_band_buffers": Field(
+            Bool,
+            default_value=False,
+            is_required=False,
+            description="Write large buffers exposed by outputs, such as those of numpy arrays, "
+            "to separate files with pickle protocol 5 (Python 3.8+). Such outputs can only be "
+            "read back with dagster.utils.read_pickled_file.",
+        ),
+    }
+)
 @experimental
 def fs_asset_store(init_context):
     """Built-in filesystem asset store that stores and retrieves values using pickling.
@@ -192,7 +202,10 @@ def pipe():
 
     """
 
-    return PickledObjectFilesystemAssetStore(init_context.resource_config["base_dir"])
+    return PickledObjectFilesystemAssetStore(
+        init_context.resource_config["base_dir"],
+        out_of_band_buffers=init_context.resource_config["out_of_band_buffers"],
+    )
 
 
 class CustomPathPickledObjectFilesystemAssetStore(AssetStore):
@@ -206,8 +219,6 @@ class CustomPathPickledObjectFilesystemAssetStore(AssetStore):
 
     def __init__(self, base_dir=None):
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
-        self.write_mode = "wb"
-        self.read_mode = "rb"
 
     def _get_path(self, path):
         return os.path.join(self.base_dir, path)
@@ -227,8 +238,7 @@ def set_asset(self, context, obj):
         # Ensure path exists
         mkdir_p(os.path.dirname(filepath))
 
-        with open(filepath, self.write_mode) as write_obj:
-            pickle.dump(obj, write_obj, PICKLE_PROTOCOL)
+        write_pickled_file(filepath, obj)
 
         return AssetMaterialization(
             asset_key=AssetKey([context.pipeline_name, context.step_key, context.output_name]),
@@ -242,8 +252,7 @@ def get_asset(self, context):
         path = check.str_param(asset_metadata.get("path"), "asset_metadata.path")
         filepath = self._get_path(path)
 
-        with open(filepath, self.read_mode) as read_obj:
-            return pickle.load(read_obj)
+        return read_pickled_file(filepath)
 
 
 @resource(config_schema={"base_dir": Field(StringSource, default_value=".", is_required=False)})
@@ -283,8 +292,6 @@ def pipe():
 class VersionedPickledObjectFilesystemAssetStore(VersionedAssetStore):
     def __init__(self, base_dir=None):
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
-        self.write_mode = "wb"
-        self.read_mode = "rb"
 
     def _get_path(self, context):
         # automatically construct filepath
@@ -306,16 +313,14 @@ def set_asset(self, context, obj):
         # Ensure path exists
         mkdir_p(os.path.dirname(filepath))
 
-        with open(filepath, self.write_mode) as write_obj:
-            pickle.dump(obj, write_obj, PICKLE_PROTOCOL)
+        write_pickled_file(filepath, obj)
 
     def get_asset(self, context):
         """Unpickle the file and Load it to a data object."""
 
         filepath = self._get_path(context)
 
-        with open(filepath, self.read_mode) as read_obj:
-            return pickle.load(read_obj)
+        return read_pickled_file(filepath)
 
     def has_asset(self, context):
         """Returns true if data object exists with the associated version, False otherwise."""
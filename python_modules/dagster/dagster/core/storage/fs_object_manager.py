@@ -1,18 +1,27 @@
 import os
-import pickle
 
-from dagster import check
+from dagster import Bool, check
 from dagster.config import Field
 from dagster.config.source import StringSource
 from dagster.core.definitions.events import AssetKey, AssetMaterialization, EventMetadataEntry
 from dagster.core.execution.context.system import InputContext, OutputContext
 from dagster.core.storage.object_manager import ObjectManager, object_manager
-from dagster.utils import PICKLE_PROTOCOL, mkdir_p
+from dagster.utils import mkdir_p, read_pickled_file, write_pickled_file
 from dagster.utils.backcompat import experimental
 
 
 @object_manager(
-    config_schema={"base_dir": Field(StringSource, default_value=".", is_required=False)}
+    config_schema={
+        "base_dir": Field(StringSource, default_value=".", is_required=False),
+        "out_of_band_buffers": Field(
+            Bool,
+            default_value=False,
+            is_required=False,
+            description="Write large buffers exposed by outputs, such as those of numpy arrays, "
+            "to separate files with pickle protocol 5 (Python 3.8+). Such outputs can only be "
+            "read back with dagster.utils.read_pickled_file.",
+        ),
+    }
 )
 def fs_object_manager(init_context):
     """Built-in filesystem object manager that stores and retrieves values using pickling.
@@ -62,7 +71,10 @@ def pipe():
 
     """
 
-    return PickledObjectFilesystemObjectManager(init_context.resource_config["base_dir"])
+    return PickledObjectFilesystemObjectManager(
+        init_context.resource_config["base_dir"],
+        out_of_band_buffers=init_context.resource_config["out_of_band_buffers"],
+    )
 
 
 class PickledObjectFilesystemObjectManager(ObjectManager):
@@ -71,12 +83,13 @@ class PickledObjectFilesystemObjectManager(ObjectManager):
     Args:
         base_dir (Optional[str]): base directory where all the step outputs which use this object
             manager will be stored in.
+        out_of_band_buffers (Optional[bool]): whether to write large buffers exposed by outputs to
+            separate files with pickle protocol 5. See :py:func:`dagster.utils.write_pickled_file`.
     """
 
-    def __init__(self, base_dir=None):
+    def __init__(self, base_dir=None, out_of_band_buffers=False):
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
-        self.write_mode = "wb"
-        self.read_mode = "rb"
+        self.out_of_band_buffers = check.bool_param(out_of_band_buffers, "out_of_band_buffers")
 
     def _get_path(self, context):
         """Automatically construct filepath."""
@@ -97,8 +110,7 @@ def handle_output(self, context, obj):
         # Ensure path exists
         mkdir_p(os.path.dirname(filepath))
 
-        with open(filepath, self.write_mode) as write_obj:
-            pickle.dump(obj, write_obj, PICKLE_PROTOCOL)
+        write_pickled_file(filepath, obj, out_of_band_buffers=self.out_of_band_buffers)
 
     def load_input(self, context):
         """Unpickle the file and Load it to a data object."""
@@ -106,8 +118,7 @@ def load_input(self, context):
 
         filepath = self._get_path(context.upstream_output)
 
-        with open(filepath, self.read_mode) as read_obj:
-            return pickle.load(read_obj)
+        return read_pickled_file(filepath)
 
 
 class CustomPathPickledObjectFilesystemObjectManager(ObjectManager):
@@ -121,8 +132,6 @@ class CustomPathPickledObjectFilesystemObjectManager(ObjectManager):
 
     def __init__(self, base_dir=None):
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
-        self.write_mode = "wb"
-        self.read_mode = "rb"
 
     def _get_path(self, path):
         return os.path.join(self.base_dir, path)
@@ -142,8 +151,7 @@ def handle_output(self, context, obj):
         # Ensure path exists
         mkdir_p(os.path.dirname(filepath))
 
-        with open(filepath, self.write_mode) as write_obj:
-            pickle.dump(obj, write_obj, PICKLE_PROTOCOL)
+        write_pickled_file(filepath, obj)
 
         return AssetMaterialization(
             asset_key=AssetKey([context.pipeline_name, context.step_key, context.name]),
@@ -157,8 +165,7 @@ def load_input(self, context):
         path = check.str_param(metadata.get("path"), "metadata.path")
         filepath = self._get_path(path)
 
-        with open(filepath, self.read_mode) as read_obj:
-            return pickle.load(read_obj)
+        return read_pickled_file(filepath)
 
 
 @object_manager(
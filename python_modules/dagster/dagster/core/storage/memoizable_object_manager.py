@@ -1,5 +1,4 @@
 import os
-import pickle
 from abc import abstractmethod
 
 from dagster import check
@@ -7,7 +6,7 @@
 from dagster.config.source import StringSource
 from dagster.core.definitions.resource import resource
 from dagster.core.storage.object_manager import ObjectManager
-from dagster.utils import PICKLE_PROTOCOL, mkdir_p
+from dagster.utils import mkdir_p, read_pickled_file, write_pickled_file
 from dagster.utils.backcompat import experimental
 
 
@@ -33,8 +32,6 @@ def has_output(self, context):
 class VersionedPickledObjectFilesystemObjectManager(MemoizableObjectManager):
     def __init__(self, base_dir=None):
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
-        self.write_mode = "wb"
-        self.read_mode = "rb"
 
     def _get_path(self, context):
         # automatically construct filepath
@@ -56,16 +53,14 @@ def handle_output(self, context, obj):
         # Ensure path exists
         mkdir_p(os.path.dirname(filepath))
 
-        with open(filepath, self.write_mode) as write_obj:
-            pickle.dump(obj, write_obj, PICKLE_PROTOCOL)
+        write_pickled_file(filepath, obj)
 
     def load_input(self, context):
         """Unpickle the file and Load it to a data object."""
 
         filepath = self._get_path(context.upstream_output)
 
-        with open(filepath, self.read_mode) as read_obj:
-            return pickle.load(read_obj)
+        return read_pickled_file(filepath)
 
     def has_output(self, context):
         """Returns true if data object exists with the associated version, False otherwise."""
@@ -81,6 +81,13 @@ def environ(env):
                 os.environ[key] = value
 
 
+def in_memory_temporary_directory():
+    """Like tempfile.TemporaryDirectory, but rooted on the /dev/shm tmpfs when it exists so that
+    files written by tests never hit disk. Only suited to small files, since /dev/shm is often
+    size-limited (64MB by default in Docker containers)."""
+    return tempfile.TemporaryDirectory(dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+
+
 @contextmanager
 def instance_for_test(overrides=None):
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -187,6 +194,11 @@ def register_managed_run_for_test(
     )
 
 
+# Cap on the exponential backoff in poll_for_event, so that a slow event is noticed shortly after
+# it lands instead of after the next doubled sleep
+POLL_MAX_BACKOFF = 0.5
+
+
 def poll_for_finished_run(instance, run_id, timeout=20):
     total_time = 0
     interval = 0.01
@@ -226,7 +238,7 @@ def poll_for_event(instance, run_id, event_type, message, timeout=30):
                     return
 
         total_time += backoff
-        backoff = backoff * 2
+        backoff = min(backoff * 2, POLL_MAX_BACKOFF)
         if total_time > timeout:
             raise Exception("Timed out")
 
@@ -3,6 +3,7 @@
 import errno
 import functools
 import inspect
+import itertools
 import os
 import pickle
 import re
@@ -37,6 +38,15 @@
 
 PICKLE_PROTOCOL = 4
 
+# Needed on Windows so that os.open does not translate line endings in pickled data
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# Pickle protocol 5 (PEP 574) lets large buffers be written out-of-band
+_PICKLE_OUT_OF_BAND = sys.version_info >= (3, 8)
+
+# Smaller buffers are cheaper to keep in the pickle stream than to write to a file of their own
+PICKLE_OUT_OF_BAND_MIN_SIZE = 1024 * 1024
+
 
 DEFAULT_REPOSITORY_YAML_FILENAME = "repository.yaml"
 DEFAULT_WORKSPACE_YAML_FILENAME = "workspace.yaml"
@@ -313,6 +323,111 @@ def touch_file(path):
         os.utime(path, None)
 
 
+def _write_file(path, data):
+    data = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def _read_file(path):
+    fd = os.open(path, os.O_RDONLY | _O_BINARY)
+    try:
+        remaining = os.fstat(fd).st_size
+        chunks = []
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    finally:
+        os.close(fd)
+
+    return b"".join(chunks)
+
+
+def _pickle_buffer_path(path, index):
+    return "{path}.buf{index}".format(path=path, index=index)
+
+
+def _read_pickle_buffers(path):
+    # Lazily reads <path>.buf0, <path>.buf1, ... so that unpickling only opens the buffers the
+    # pickle stream actually refers to. The buffers are read into memory rather than mmapped: a
+    # mapping would tie the loaded object to a file that a later write to the same path truncates.
+    for index in itertools.count():
+        with open(_pickle_buffer_path(path, index), "rb", buffering=0) as read_obj:
+            buf = bytearray(os.fstat(read_obj.fileno()).st_size)
+            view = memoryview(buf)
+            while view:
+                read = read_obj.readinto(view)
+                if not read:
+                    break
+                view = view[read:]
+        yield buf
+
+
+def _remove_pickle_buffers(path):
+    # Buffer files are numbered contiguously, so stop at the first one that doesn't exist
+    for index in itertools.count():
+        try:
+            os.remove(_pickle_buffer_path(path, index))
+        except FileNotFoundError:
+            return
+
+
+def write_pickled_file(path, obj, out_of_band_buffers=False):
+    """Pickle ``obj`` in memory and write it to ``path`` with raw ``os.write`` calls, bypassing
+    the buffered ``io`` stack.
+
+    By default ``obj`` is pickled with ``PICKLE_PROTOCOL`` into a single file, which can be read
+    back with a plain ``pickle.load``.
+
+    If ``out_of_band_buffers`` is set and the interpreter is Python 3.8+, ``obj`` is pickled with
+    protocol 5 instead, and buffers of at least ``PICKLE_OUT_OF_BAND_MIN_SIZE`` bytes exposed by it
+    (PEP 574), such as those of large contiguous numpy arrays, are written as-is to
+    ``<path>.buf0``, ``<path>.buf1``, ... rather than being copied into the pickle stream. Such
+    files can only be read back with :py:func:`read_pickled_file` on Python 3.8+.
+    """
+    buffers = []
+
+    def _collect_buffer(buf):
+        # Returning a truthy value keeps the buffer in-band
+        if buf.raw().nbytes < PICKLE_OUT_OF_BAND_MIN_SIZE:
+            return True
+        buffers.append(buf)
+        return False
+
+    if out_of_band_buffers and _PICKLE_OUT_OF_BAND:
+        data = pickle.dumps(obj, protocol=5, buffer_callback=_collect_buffer)
+    else:
+        data = pickle.dumps(obj, PICKLE_PROTOCOL)
+
+    # Remove the buffers of any previous value before writing the new stream, so that a write that
+    # fails part way fails loudly on read instead of mixing old and new data
+    _remove_pickle_buffers(path)
+    _write_file(path, data)
+    for index, buf in enumerate(buffers):
+        # Write each buffer under a temporary name so that a buffer file is only ever complete
+        buffer_path = _pickle_buffer_path(path, index)
+        tmp_path = "{}.tmp".format(buffer_path)
+        _write_file(tmp_path, buf.raw())
+        os.replace(tmp_path, buffer_path)
+
+
+def read_pickled_file(path):
+    """Read the whole file at ``path`` with raw ``os.read`` calls and unpickle it, along with any
+    out-of-band buffers written alongside it by :py:func:`write_pickled_file`."""
+    data = _read_file(path)
+    if _PICKLE_OUT_OF_BAND:
+        return pickle.loads(data, buffers=_read_pickle_buffers(path))
+
+    return pickle.loads(data)
+
+
 def _kill_on_event(termination_event):
     termination_event.wait()
     send_interrupt()
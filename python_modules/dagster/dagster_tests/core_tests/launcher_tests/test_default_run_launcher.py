@@ -49,8 +49,11 @@ def crashy_pipeline():
 
 @solid
 def sleepy_solid(_):
+    # Termination signals interrupt a long sleep right away on posix, but on Windows the interrupt
+    # is only raised once sleep returns, so keep the wakeups short there
+    interval = 0.1 if seven.IS_WINDOWS else 3600
     while True:
-        time.sleep(0.1)
+        time.sleep(interval)
 
 
 @pipeline
@@ -99,14 +102,16 @@ def nope():
     return [noop_pipeline, crashy_pipeline, sleepy_pipeline, slow_pipeline, math_diamond]
 
 
+NOPE_LOADABLE_TARGET_ORIGIN = LoadableTargetOrigin(
+    executable_path=sys.executable,
+    attribute="nope",
+    python_file=file_relative_path(__file__, "test_default_run_launcher.py"),
+)
+
+
 @contextmanager
 def get_external_pipeline_from_grpc_server_repository(pipeline_name):
-    loadable_target_origin = LoadableTargetOrigin(
-        executable_path=sys.executable,
-        attribute="nope",
-        python_file=file_relative_path(__file__, "test_default_run_launcher.py"),
-    )
-    server_process = GrpcServerProcess(loadable_target_origin=loadable_target_origin)
+    server_process = GrpcServerProcess(loadable_target_origin=NOPE_LOADABLE_TARGET_ORIGIN)
 
     try:
         with server_process.create_ephemeral_client() as api_client:
@@ -132,12 +137,7 @@ def get_external_pipeline_from_grpc_server_repository(pipeline_name):
 def get_external_pipeline_from_managed_grpc_python_env_repository(pipeline_name):
     with RepositoryLocationHandle.create_from_repository_location_origin(
         ManagedGrpcPythonEnvRepositoryLocationOrigin(
-            loadable_target_origin=LoadableTargetOrigin(
-                executable_path=sys.executable,
-                attribute="nope",
-                python_file=file_relative_path(__file__, "test_default_run_launcher.py"),
-            ),
-            location_name="nope",
+            loadable_target_origin=NOPE_LOADABLE_TARGET_ORIGIN, location_name="nope",
         )
     ) as repository_location_handle:
         repository_location = GrpcServerRepositoryLocation(repository_location_handle)
@@ -1,4 +1,17 @@
-from dagster.utils import file_relative_path, safe_isfile
+import os
+import pickle
+import sys
+import tempfile
+
+import pytest
+from dagster.utils import (
+    PICKLE_OUT_OF_BAND_MIN_SIZE,
+    PICKLE_PROTOCOL,
+    file_relative_path,
+    read_pickled_file,
+    safe_isfile,
+    write_pickled_file,
+)
 
 
 def test_safe_isfile():
@@ -8,3 +21,87 @@ def test_safe_isfile():
 
 def test_script_relative_path_file_relative_path_equiv():
     assert file_relative_path(__file__, "foo") == file_relative_path(__file__, "foo")
+
+
+def test_pickled_file_round_trip():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        filepath = os.path.join(tmpdir_path, "obj")
+        obj = {"small": [1, 2, 3], "large": list(range(100000))}
+
+        write_pickled_file(filepath, obj)
+        with open(filepath, "rb") as read_obj:
+            data = read_obj.read()
+        # payloads without out-of-band buffers stay on PICKLE_PROTOCOL: PROTO opcode, then version
+        assert data[:2] == bytes([0x80, PICKLE_PROTOCOL])
+        assert pickle.loads(data) == obj
+        assert not os.path.exists(filepath + ".buf0")
+        assert read_pickled_file(filepath) == obj
+
+        # overwriting with a smaller payload truncates the file
+        write_pickled_file(filepath, 1)
+        assert read_pickled_file(filepath) == 1
+
+
+class BufferHolder:
+    """Exposes its data as an out-of-band buffer under protocol 5, like a numpy array."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return BufferHolder, (pickle.PickleBuffer(self.data),)
+        return BufferHolder, (self.data,)
+
+
+def test_pickled_file_ignores_buffers_by_default():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        filepath = os.path.join(tmpdir_path, "obj")
+        data = bytearray(PICKLE_OUT_OF_BAND_MIN_SIZE)
+
+        write_pickled_file(filepath, BufferHolder(data))
+        assert not os.path.exists(filepath + ".buf0")
+        with open(filepath, "rb") as read_obj:
+            assert pickle.load(read_obj).data == data
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="Out-of-band pickling requires Python 3.8+")
+def test_pickled_file_out_of_band_buffers():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        filepath = os.path.join(tmpdir_path, "obj")
+        large = bytearray(b"x" * PICKLE_OUT_OF_BAND_MIN_SIZE)
+        small = bytearray(b"y" * 1024)
+
+        write_pickled_file(
+            filepath,
+            [1, pickle.PickleBuffer(large), pickle.PickleBuffer(small), pickle.PickleBuffer(large)],
+            out_of_band_buffers=True,
+        )
+        # buffers below the size threshold stay in the pickle stream
+        assert os.path.isfile(filepath + ".buf0")
+        assert os.path.isfile(filepath + ".buf1")
+        assert not os.path.exists(filepath + ".buf2")
+        assert not os.path.exists(filepath + ".buf0.tmp")
+
+        one, first, in_band, second = read_pickled_file(filepath)
+        assert one == 1
+        assert bytes(first) == bytes(large)
+        assert bytes(in_band) == bytes(small)
+        assert bytes(second) == bytes(large)
+
+        # overwriting with fewer buffers removes the stale buffer files
+        write_pickled_file(filepath, [pickle.PickleBuffer(large)], out_of_band_buffers=True)
+        assert os.path.isfile(filepath + ".buf0")
+        assert not os.path.exists(filepath + ".buf1")
+        [buf] = read_pickled_file(filepath)
+        assert bytes(buf) == bytes(large)
+
+        write_pickled_file(filepath, [1, 2], out_of_band_buffers=True)
+        assert not os.path.exists(filepath + ".buf0")
+        assert read_pickled_file(filepath) == [1, 2]
+
+        # a missing buffer file fails loudly instead of loading stale data
+        write_pickled_file(filepath, [pickle.PickleBuffer(large)], out_of_band_buffers=True)
+        os.remove(filepath + ".buf0")
+        with pytest.raises(FileNotFoundError):
+            read_pickled_file(filepath)